@@ -31,6 +31,7 @@ ALLOWED_HOSTS = []
 # Application definition
 
 INSTALLED_APPS = [
+    'daphne',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -69,6 +70,10 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'GJtemplate.wsgi.application'
 
+# The tracker API views are async; serve them over ASGI (daphne also takes
+# over runserver) so they run on the event loop instead of an async_to_sync hop.
+ASGI_APPLICATION = 'GJtemplate.asgi.application'
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
@@ -121,3 +126,7 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Tracker API: read CSVs with aiofiles inside the async views. Set to False to
+# fall back to the synchronous readers (run in a worker thread via sync_to_async).
+TRACKER_ASYNC_IO = True
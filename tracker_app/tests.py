@@ -1,3 +1,143 @@
-from django.test import TestCase
+import asyncio
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import orjson
+from django.test import SimpleTestCase
+
+from . import views
 
 # Create your tests here.
+
+
+class SingleColumnWriteTests(SimpleTestCase):
+    """Queued one-column writes: coalescing, precedence, concurrency and superseding."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.base = Path(tmp.name)
+        (self.base / "master_data").mkdir()
+        self.path = self.base / "master_data/seniors.csv"
+        self.path.write_text("Senior\nAlice\nBob\n", encoding="utf-8")
+
+        patcher = mock.patch.object(views, "BASE_DIR", self.base)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # A non-None sentinel keeps the background writer from starting, so
+        # each test decides when pending state is flushed.
+        patcher = mock.patch.object(views, "_writer_thread", object())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._reset_state)
+
+    def _reset_state(self):
+        with views._CSV_LOCK:
+            views._PENDING.clear()
+            views._CSV_CACHE.clear()
+        while not views._WRITE_QUEUE.empty():
+            views._WRITE_QUEUE.get_nowait()
+            views._WRITE_QUEUE.task_done()
+
+    def _add(self, name):
+        return self.client.post(
+            "/tracker/add_senior", orjson.dumps({"name": name}), content_type="application/json",
+        )
+
+    def _lines(self):
+        return self.path.read_text(encoding="utf-8").splitlines()
+
+    def test_repeated_updates_coalesce_into_one_write(self):
+        for name in ("Carol", "Dave", "Eve"):
+            self.assertEqual(self._add(name).status_code, 200)
+
+        with mock.patch.object(views, "_store_single_column", wraps=views._store_single_column) as store:
+            while not views._WRITE_QUEUE.empty():
+                views._flush_pending(views._WRITE_QUEUE.get_nowait())
+                views._WRITE_QUEUE.task_done()
+
+        self.assertEqual(store.call_count, 1)
+        self.assertEqual(self._lines(), ["Senior", "Alice", "Bob", "Carol", "Dave", "Eve"])
+
+    def test_pending_state_takes_precedence_over_file(self):
+        self._add("Carol")
+        # A hand edit while the update is still queued must not be read back
+        self.path.write_text("Senior\nZed\n", encoding="utf-8")
+
+        response = self.client.get("/tracker/master-data/")
+        self.assertEqual(orjson.loads(response.content)["seniors"], ["Alice", "Bob", "Carol"])
+        self.assertEqual(self._add("Carol").status_code, 400)
+
+    def test_failed_flush_keeps_pending_state(self):
+        self._add("Carol")
+
+        with mock.patch.object(views, "_store_single_column", side_effect=OSError("disk full")):
+            self.assertEqual(views._flush_pending(self.path), [self.path])
+
+        self.assertIn(self.path, views._PENDING)
+        response = self.client.get("/tracker/master-data/")
+        self.assertEqual(orjson.loads(response.content)["seniors"], ["Alice", "Bob", "Carol"])
+
+        # The retry writes the state the API reported
+        self.assertEqual(views._flush_pending(self.path), [])
+        self.assertEqual(self._lines(), ["Senior", "Alice", "Bob", "Carol"])
+
+    async def _add_members(self, names):
+        return await asyncio.gather(*(
+            self.async_client.post(
+                "/tracker/add_member", orjson.dumps({"name": name}), content_type="application/json",
+            )
+            for name in names
+        ))
+
+    def _assert_each_added_once(self, names, responses):
+        statuses = [r.status_code for r in responses]
+        self.assertEqual(statuses.count(200), len(set(names)))
+        self.assertEqual(statuses.count(400), len(names) - len(set(names)))
+        views._flush_pending()
+        lines = (self.base / "master_data/members.csv").read_text(encoding="utf-8").splitlines()
+        self.assertEqual(lines[:2], ["Member", "Alice"])
+        self.assertCountEqual(lines[2:], set(names))
+
+    async def test_concurrent_adds_are_not_lost(self):
+        (self.base / "master_data/members.csv").write_text("Member\nAlice\n", encoding="utf-8")
+        # Every name is posted twice: one request must win and the other see a duplicate
+        names = [f"Name {i}" for i in range(20)] * 2
+
+        responses = await self._add_members(names)
+
+        self._assert_each_added_once(names, responses)
+
+    async def test_concurrent_adds_wait_for_a_held_lock(self):
+        (self.base / "master_data/members.csv").write_text("Member\nAlice\n", encoding="utf-8")
+        names = [f"Name {i}" for i in range(20)] * 2
+
+        with mock.patch.object(views, "_run_locked", wraps=views._run_locked) as run_locked:
+            # While another writer holds the lock, _alocked hands the work to worker threads
+            views._CSV_LOCK.acquire()
+            try:
+                adds = asyncio.ensure_future(self._add_members(names))
+                await asyncio.sleep(0.1)
+                self.assertFalse(adds.done())
+            finally:
+                views._CSV_LOCK.release()
+            responses = await adds
+
+        self.assertTrue(run_locked.called)
+        self._assert_each_added_once(names, responses)
+
+    def test_master_data_save_supersedes_pending_state(self):
+        self._add("Carol")
+
+        response = self.client.post(
+            "/tracker/master-data/save/",
+            orjson.dumps({"seniors": ["Xavier"]}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(self.path, views._PENDING)
+
+        # The queued path is still delivered to the writer, but has nothing left to write
+        views._flush_pending(self.path)
+        self.assertEqual(self._lines(), ["Senior", "Xavier"])
@@ -1,5 +1,85 @@
+from functools import partial
+
 from django.urls import path
+from django.views.decorators.csrf import csrf_exempt
+
 from . import views
+
+
+def master_list(view, **options):
+    """Bind a generic master-list view to one CSV (partial drops csrf_exempt, so reapply it)."""
+    return csrf_exempt(partial(view, **options))
+
+
+# One-column master lists served by views.api_master_add / api_master_remove.
+# Each entry becomes add_<key> and remove_<key> (named api_add_<key> /
+# api_remove_<key>); "add" and "remove" hold the options only that view takes.
+MASTER_LISTS = {
+    "senior": {
+        "filename": "master_data/seniors.csv",
+        "header": "Senior",
+        "resp_key": "seniors",
+        "add": {"empty_err": "Name is required", "exists_err": "Senior already exists"},
+        "remove": {"missing_err": "Senior not found"},
+    },
+    "member": {
+        "filename": "master_data/members.csv",
+        "header": "Member",
+        "resp_key": "members",
+        "add": {"empty_err": "Name is required", "exists_err": "Member already exists"},
+        "remove": {"missing_err": "Member not found"},
+    },
+    "proposal_status": {
+        "filename": "master_data/proposal_status.csv",
+        "header": "proposalStatus",
+        "resp_key": "proposalStatuses",
+        "field": "status",
+        "ok_status": False,
+        "add": {"empty_err": "No status given", "exists_err": "Status already exists"},
+        "remove": {},
+    },
+    "gstr9_status": {
+        "filename": "master_data/gstr9_status.csv",
+        "header": "gstr9Status",
+        "resp_key": "gstr9Statuses",
+        "field": "status",
+        "ok_status": False,
+        "add": {"exists_err": "Status already exists"},
+        "remove": {},
+    },
+    "gstr9c_status": {
+        "filename": "master_data/gstr9c_status.csv",
+        "header": "gstr9cStatus",
+        "resp_key": "gstr9cStatuses",
+        "field": "status",
+        "ok_status": False,
+        "add": {"exists_err": "Status already exists"},
+        "remove": {},
+    },
+    "custom_column": {
+        "filename": "master_data/custom_columns.csv",
+        "header": "Custom Column",
+        "resp_key": "customColumns",
+        "add": {"empty_err": "Column name is required", "exists_err": "Custom column already exists"},
+        "remove": {"missing_err": "Custom column not found"},
+    },
+}
+
+
+def master_list_routes():
+    """Build the add_<key> / remove_<key> routes for every entry in MASTER_LISTS."""
+    routes = []
+    for key, spec in MASTER_LISTS.items():
+        common = {k: v for k, v in spec.items() if k not in ("add", "remove")}
+        for action, view in (("add", views.api_master_add), ("remove", views.api_master_remove)):
+            routes.append(path(
+                f"{action}_{key}",
+                master_list(view, **common, **spec[action]),
+                name=f"api_{action}_{key}",
+            ))
+    return routes
+
+
 urlpatterns = [
     path("", views.tracker_home, name="tracker-home"),
     path("clients/", views.api_clients, name="api-clients"),
@@ -10,22 +90,7 @@ urlpatterns = [
         views.api_master_data_save,
         name="api-master-data-save",
     ),
-    path("add_senior", views.api_add_senior),
-    path("remove_senior", views.api_remove_senior),
-    path("add_member", views.api_add_member),
-    path("remove_member", views.api_remove_member),
-
-    path("add_proposal_status", views.api_add_proposal_status),
-    path("remove_proposal_status", views.api_remove_proposal_status),
-
-    path("add_gstr9_status", views.api_add_gstr9_status),
-    path("remove_gstr9_status", views.api_remove_gstr9_status),
-
-    path("add_gstr9c_status", views.api_add_gstr9c_status),
-    path("remove_gstr9c_status", views.api_remove_gstr9c_status),
-
-    path("add_custom_column", views.api_add_custom_column, name="api_add_custom_column"),
-    path("remove_custom_column", views.api_remove_custom_column, name="api_remove_custom_column"),
+    *master_list_routes(),
     path("upload_tracker/", views.api_upload_tracker, name = "api_upload_tracker"),
     path("clear_clients/",views.api_clear_clients, name = "api_clear_clients")
-]
\ No newline at end of file
+]
@@ -1,19 +1,33 @@
 from django.shortcuts import render
 
 # Create your views here.
+import asyncio
+import atexit
 import csv
-import json
+import io
+import os
+import re
+import tempfile
 from pathlib import Path
 import logging # <-- Import logging module
+import queue
+import threading
 
-from django.http import JsonResponse, HttpResponseNotAllowed
+import aiofiles
+import numpy as np
+import orjson
+import pandas as pd
+import xxhash
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotAllowed, StreamingHttpResponse
+from django.views.decorators.gzip import gzip_page
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from django.shortcuts import render 
 
 # Get an instance of a logger
-logger = logging.getLogger(__name__) # <-- Logger instance
-logger.setLevel(logging.INFO) # Set logger to process INFO level messages (Recommended setting for visibility)
+logger = logging.getLogger(__name__) # <-- Logger instance (level is governed by Django's LOGGING config)
 
 # Assuming your views.py is inside an app directory, or directly accessible from the project root.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -28,60 +42,406 @@ ALL_CLIENT_HEADERS = [
 ]
 
 
+def _json(payload, status=200):
+    """Serialize payload with orjson into an application/json response."""
+    return HttpResponse(orjson.dumps(payload), status=status, content_type="application/json")
+
+
+# In-memory cache of parsed CSV files: {path: (st_mtime_ns, st_size, rows, meta)}.
+# `meta` is a frozenset of the values for one-column files; for input_csv.csv it is
+# the digest of the saved payload that produced the file (None after a plain read).
+# Client rows are stored column-oriented ({header: [values]}, see _client_columns).
+# An entry is only trusted while the file's mtime and size are unchanged on disk.
+_CSV_CACHE = {}
+_CSV_LOCK = threading.Lock()
+
+
+def _cache_get(path, st=None):
+    """Return the cache entry for path if the file is unchanged on disk, else None."""
+    st = st or path.stat()
+    entry = _CSV_CACHE.get(path)
+    if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry
+    return None
+
+
+def _cache_put(path, rows, meta=None, st=None):
+    """Store rows for path together with its stat signature (the current one by default)."""
+    st = st or path.stat()
+    _CSV_CACHE[path] = (st.st_mtime_ns, st.st_size, rows, meta)
+
+
+def _lookup_cache(path):
+    """Return (stat, cache entry or None) for path. Callers must hold _CSV_LOCK."""
+    st = path.stat()
+    return st, _cache_get(path, st)
+
+
+def _run_locked(fn, *args):
+    """Call fn(*args) while holding _CSV_LOCK."""
+    with _CSV_LOCK:
+        return fn(*args)
+
+
+async def _alocked(fn, *args):
+    """Run fn(*args) under _CSV_LOCK without blocking the event loop.
+
+    An uncontended lock is taken inline. If a writer holds it, the call is
+    handed to a worker thread to wait there instead of on the loop.
+    """
+    if _CSV_LOCK.acquire(blocking=False):
+        try:
+            return fn(*args)
+        finally:
+            _CSV_LOCK.release()
+    return await sync_to_async(_run_locked, thread_sensitive=False)(fn, *args)
+
+
+def _async_io_enabled():
+    """Whether async views read CSVs with aiofiles (settings.TRACKER_ASYNC_IO, default on)."""
+    return getattr(settings, "TRACKER_ASYNC_IO", True)
+
+
+def _atomic_write(path, text):
+    """Write text to path in one call via a temp file, then swap it into place.
+
+    The temp file gets a unique name, so writers in other worker processes
+    (which _CSV_LOCK does not serialize) never share or publish each other's
+    half-written file.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(text.encode("utf-8"))
+        # mkstemp creates the file as 0600; keep the permissions the file had
+        os.chmod(tmp, path.stat().st_mode & 0o777 if path.exists() else 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+async def _aread_text(path):
+    """Read a whole UTF-8 text file without blocking the event loop."""
+    async with aiofiles.open(path, mode="r", encoding="utf-8", newline="") as f:
+        return await f.read()
+
+
+def _client_columns(rows):
+    """Turn client dicts into {header: [str values]}, one list per ALL_CLIENT_HEADERS entry.
+
+    Parallel string lists avoid a 20-key dict per client; rows are only
+    materialized again by _iter_client_rows when serializing.
+    """
+    return {
+        h: ["" if row.get(h) is None else str(row.get(h)) for row in rows]
+        for h in ALL_CLIENT_HEADERS
+    }
+
+
+def _iter_client_rows(columns):
+    """Yield one client dict at a time from a column store."""
+    for values in zip(*(columns[h] for h in ALL_CLIENT_HEADERS)):
+        yield dict(zip(ALL_CLIENT_HEADERS, values))
+
+
+_NO_CLIENTS = {h: [] for h in ALL_CLIENT_HEADERS}
+
+
+def _parse_clients(source):
+    """Parse the client CSV (a path or text buffer) into a column store."""
+    try:
+        df = pd.read_csv(source, dtype=str, keep_default_na=False, na_filter=False)
+    except pd.errors.EmptyDataError:
+        return _NO_CLIENTS
+    df = df.reindex(columns=ALL_CLIENT_HEADERS, fill_value="")
+    return {h: df[h].tolist() for h in ALL_CLIENT_HEADERS}
+
+
 def _read_clients_from_csv():
-    """Read main client data from input_csv.csv and return list of dicts."""
+    """Read main client data from input_csv.csv as a column store: {header: [values]}.
+
+    The lists are shared with the cache, so callers must treat them as read-only.
+    """
     csv_path = BASE_DIR / "master_data/input_csv.csv"
     if not csv_path.exists():
-        return []
+        return _NO_CLIENTS
+
+    with _CSV_LOCK:
+        entry = _cache_get(csv_path)
+        if entry is not None:
+            return entry[2]
+        clients = _parse_clients(csv_path)
+        _cache_put(csv_path, clients)
+        return clients
 
-    with csv_path.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        return list(reader)
 
+async def _aread_clients_from_csv():
+    """Async _read_clients_from_csv: a cache miss reads the file with aiofiles."""
+    if not _async_io_enabled():
+        return await sync_to_async(_read_clients_from_csv)()
 
-def _write_clients_to_csv(clients):
-    """Overwrite input_csv.csv with provided client dicts, ensuring all headers are present."""
+    csv_path = BASE_DIR / "master_data/input_csv.csv"
+    if not csv_path.exists():
+        return _NO_CLIENTS
+
+    st, entry = await _alocked(_lookup_cache, csv_path)
+    if entry is not None:
+        return entry[2]
+    # Don't hold the lock across the await; the pre-read stat keeps the entry honest
+    clients = _parse_clients(io.StringIO(await _aread_text(csv_path)))
+    await _alocked(_cache_put, csv_path, clients, None, st)
+    return clients
+
+
+def _clients_digest(clients):
+    """Cheap content hash of a clients payload, independent of key order."""
+    return xxhash.xxh3_64_hexdigest(orjson.dumps(clients, option=orjson.OPT_SORT_KEYS))
+
+
+def _write_clients_to_csv(clients, digest=None):
+    """Overwrite input_csv.csv with provided client dicts, ensuring all headers are present.
+
+    If digest (see _clients_digest) matches the payload that produced the
+    current, unmodified file, the write is skipped. Returns whether it wrote.
+    """
     csv_path = BASE_DIR / "master_data/input_csv.csv"
     
     headers = ALL_CLIENT_HEADERS
 
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        
-        for row in clients:
-            writer.writerow(row)
+    with _CSV_LOCK:
+        if digest is not None and csv_path.exists():
+            entry = _cache_get(csv_path)
+            if entry is not None and entry[3] == digest:
+                return False
 
+        # Normalize once into the column store: it is both what we cache and the
+        # source of fixed-order rows for csv.writer.writerows (C fast path, no
+        # per-row DictWriter key lookups).
+        columns = _client_columns(clients)
 
-def _read_single_column_csv(filename):
-    """Read a simple one-column CSV (header + values) into a list of strings."""
-    path = BASE_DIR / filename
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(headers)
+        writer.writerows(zip(*(columns[h] for h in headers)))
+        _atomic_write(csv_path, buf.getvalue())
+
+        # Cache the rows exactly as a fresh read of the file would return them.
+        _cache_put(csv_path, columns, digest)
+    return True
+
+
+def _write_clients_frame(df):
+    """Overwrite input_csv.csv straight from a DataFrame whose columns include ALL_CLIENT_HEADERS."""
+    csv_path = BASE_DIR / "master_data/input_csv.csv"
+
+    with _CSV_LOCK:
+        _atomic_write(csv_path, df[ALL_CLIENT_HEADERS].to_csv(index=False, lineterminator="\n"))
+        # Don't build row dicts up front; the next read re-parses the file.
+        _CSV_CACHE.pop(csv_path, None)
+
+
+# One-column writes accepted in memory but not yet flushed to disk:
+# {path: (header, values, members)}. While a path is pending, its in-memory
+# values are authoritative over the file. A single background thread drains
+# _WRITE_QUEUE; repeated updates to a path collapse into one write of the latest state.
+# A failed flush keeps its pending state and is re-queued with exponential
+# backoff; _RETRIES counts consecutive failures per path.
+_PENDING = {}
+_WRITE_QUEUE = queue.Queue()
+_writer_thread = None
+_RETRIES = {}
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 30.0
+
+
+def _load_single_column(path):
+    """Return the current (values, members) of a one-column CSV, parsing it on a miss.
+
+    Callers must hold _CSV_LOCK.
+    """
+    pending = _PENDING.get(path)
+    if pending is not None:
+        return pending[1], pending[2]
+    if not path.exists():
+        return [], frozenset()
+    entry = _cache_get(path)
+    if entry is None:
+        values = _parse_single_column(path)
+        _cache_put(path, values, frozenset(values))
+        entry = _CSV_CACHE[path]
+    return entry[2], entry[3]
+
+
+async def _aload_single_column(path):
+    """Async _load_single_column: a cache miss reads the file with aiofiles."""
+    if not _async_io_enabled():
+        return await sync_to_async(_locked_load_single_column)(path)
+
+    loaded, st = await _alocked(_peek_single_column, path)
+    if loaded is not None:
+        return loaded
+    # Don't hold the lock across the await; the pre-read stat keeps the entry honest
+    values = _parse_single_column(io.StringIO(await _aread_text(path)))
+    members = frozenset(values)
+    await _alocked(_cache_put, path, values, members, st)
+    return values, members
+
+
+def _peek_single_column(path):
+    """Return ((values, members), stat) without parsing; (None, stat) on a cache miss.
+
+    Callers must hold _CSV_LOCK.
+    """
+    pending = _PENDING.get(path)
+    if pending is not None:
+        return (pending[1], pending[2]), None
     if not path.exists():
+        return ([], frozenset()), None
+    st, entry = _lookup_cache(path)
+    if entry is not None:
+        return (entry[2], entry[3]), st
+    return None, st
+
+
+def _locked_load_single_column(path):
+    """_load_single_column for callers that don't already hold _CSV_LOCK."""
+    with _CSV_LOCK:
+        return _load_single_column(path)
+
+
+def _parse_single_column(source):
+    """Parse a one-column CSV (a path or text buffer) into a list of strings."""
+    try:
+        # header=0 consumes the header row; blank lines are skipped. usecols=[0]
+        # keeps only the first field, like csv.reader's r[0]: stray commas in a
+        # hand-edited row are ignored and column 0 is never taken as the index.
+        df = pd.read_csv(source, header=0, usecols=[0], dtype=str, keep_default_na=False, na_filter=False)
+    except pd.errors.EmptyDataError:
         return []
-    with path.open(newline="", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        rows = list(reader)
-        # skip header if present
-        return [r[0] for r in rows[1:] if r]
+    return df.iloc[:, 0].tolist()
+
+
+async def _aread_single_column_csvs(filenames):
+    """Read several one-column CSVs: {filename: values}.
+
+    Cache misses are read concurrently, so a cold load waits for the slowest
+    file rather than the sum of all of them. The lists are shared with the
+    cache, so callers must treat them as read-only.
+    """
+    loaded = await asyncio.gather(*(_aload_single_column(BASE_DIR / name) for name in filenames))
+    return {name: values for name, (values, _) in zip(filenames, loaded)}
+
+
+def _store_single_column(path, header, values):
+    """Atomically write values to path and refresh its cache entry.
+
+    Callers must hold _CSV_LOCK.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow([header])
+    writer.writerows([v] for v in values)
+    _atomic_write(path, buf.getvalue())
+    _cache_put(path, values, frozenset(values))
 
 
 def _write_single_column_csv(filename, header, values):
     """Write a single list of values into a one-column CSV file."""
     path = BASE_DIR / filename
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow([header])
-        for v in values:
-            writer.writerow([v])
+    values = ["" if v is None else str(v) for v in values]
+    with _CSV_LOCK:
+        # This write supersedes any queued state for the same file
+        _PENDING.pop(path, None)
+        _store_single_column(path, header, values)
+
+
+def _flush_pending(path=None):
+    """Write pending state to disk: for one path, or for every pending path if None.
+
+    Returns the paths whose write failed. Their state stays in _PENDING, so
+    reads keep returning what the API already reported.
+    """
+    failed = []
+    with _CSV_LOCK:
+        paths = [path] if path is not None else list(_PENDING)
+        for p in paths:
+            pending = _PENDING.pop(p, None)
+            if pending is None:
+                # Already flushed by an earlier queue item (coalesced)
+                continue
+            header, values, _ = pending
+            try:
+                _store_single_column(p, header, values)
+            except Exception as exc:
+                logger.error(f"Error flushing {p}: {exc}", exc_info=True)
+                # No newer state can have arrived: we held the lock throughout
+                _PENDING[p] = pending
+                failed.append(p)
+    return failed
+
+
+def _writer_loop():
+    """Background writer: flush each queued path to disk, retrying failures with backoff."""
+    while True:
+        path = _WRITE_QUEUE.get()
+        if _flush_pending(path):
+            attempt = _RETRIES.get(path, 0)
+            _RETRIES[path] = attempt + 1
+            delay = min(_RETRY_BASE_DELAY * 2 ** attempt, _RETRY_MAX_DELAY)
+            retry = threading.Timer(delay, _WRITE_QUEUE.put, (path,))
+            retry.daemon = True
+            retry.start()
+        else:
+            _RETRIES.pop(path, None)
+        _WRITE_QUEUE.task_done()
+
+
+def _apply_single_column(path, header, fn):
+    """Apply fn to the current contents of a one-column CSV and flush it in the background.
+
+    fn(values, members) returns the new list of values, or None to leave the
+    file alone. Load, change and enqueue happen in one locked section, so
+    concurrent updates to the same file cannot overwrite each other.
+    Returns (values, changed). Callers must hold _CSV_LOCK.
+    """
+    global _writer_thread
+    values, members = _load_single_column(path)
+    updated = fn(values, members)
+    if updated is None:
+        return values, False
+    updated = ["" if v is None else str(v) for v in updated]
+    _PENDING[path] = (header, updated, frozenset(updated))
+    if _writer_thread is None:
+        _writer_thread = threading.Thread(target=_writer_loop, name="csv-writer", daemon=True)
+        _writer_thread.start()
+    _WRITE_QUEUE.put(path)
+    return updated, True
+
 
+# The writer thread is a daemon; don't lose accepted updates on interpreter exit.
+atexit.register(_flush_pending)
 
+
+async def _stream_clients(columns):
+    """Yield the {"clients": [...]} JSON body one serialized record at a time."""
+    yield b'{"clients":['
+    for i, row in enumerate(_iter_client_rows(columns)):
+        yield (b"," if i else b"") + orjson.dumps(row)
+    yield b"]}"
+
+
+@gzip_page
 @require_http_methods(["GET"])
-def api_clients(request):
+async def api_clients(request):
     """
-    GET: return all clients as JSON list.
+    GET: return all clients as JSON list, streamed record by record.
     """
-    clients = _read_clients_from_csv()
-    return JsonResponse({"clients": clients})
+    clients = await _aread_clients_from_csv()
+    return StreamingHttpResponse(_stream_clients(clients), content_type="application/json")
 
 
 @csrf_exempt
@@ -95,42 +455,23 @@ def api_clients_save(request):
     clients = [] 
     
     try:
-        # Load the raw payload and decode it
-        raw_body = request.body.decode("utf-8") or "{}"
-        payload = json.loads(raw_body)
+        # Load the raw payload (orjson parses the UTF-8 bytes directly)
+        payload = orjson.loads(request.body or b"{}")
         
         clients = payload.get("clients", []) 
         
         if not isinstance(clients, list):
             raise ValueError("clients must be a list")
 
-        # --- DEBUG LOGGING (Changed to WARN/ERROR for visibility) ---
-        logger.warning(f"--- API CLIENTS SAVE TRIGGERED (Visible Log) ---")
-        logger.warning(f"Received {len(clients)} client records.")
+        # --- DEBUG LOGGING (guarded so nothing is formatted unless DEBUG is enabled) ---
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("--- API CLIENTS SAVE TRIGGERED ---")
+            logger.debug("Received %d client records.", len(clients))
+            if clients:
+                # Log the first client to check for the status reset issue
+                logger.debug("Client %d: %s", 1, clients[0])
 
         if clients:
-            # Log statuses for the first 5 clients to check for the reset issue
-            for i in range(min(1, len(clients))):
-                client = clients[i]
-                logger.warning(
-                    f"Client {i+1} Statuses: "
-                    f"Name='{client.get('clientName', 'N/A')}', "
-                    f"GSTR-9='{client.get('gstr9Status', 'MISSING')}', "
-                    f"GSTR-9C='{client.get('gstr9cStatus', 'MISSING')}', "
-                    f"Senior='{client.get('senior', 'MISSING')}'"
-                    f"Member='{client.get('member', 'MISSING')}'"
-                    f"Turnover='{client.get('turnover', 'MISSING')}'"
-                    f"Papilio ID='{client.get('papilioId', 'MISSING')}'"
-                    f"Proposal Status='{client.get('proposalStatus', 'MISSING')}'"
-                    f"Target Date='{client.get('targetDate', 'MISSING')}'"
-                    f"GSTR-9 ARN='{client.get('gstr9Arn', 'MISSING')}'"
-                    f"GSTR-9 Date='{client.get('gstr9Date', 'MISSING')}'"
-                    f"GSTR-9C ARN='{client.get('gstr9cArn', 'MISSING')}'"
-                    f"GSTR-9C Date='{client.get('gstr9cDate', 'MISSING')}'"
-                    f"Mail Sent='{client.get('mailSent', 'MISSING')}'"
-                    f"Papilio Update='{client.get('papilioUpdate', 'MISSING')}'"
-                )
-            
             # Check for missing headers (sparse data check)
             first_client_keys = set(clients[0].keys())
             missing_keys = set(ALL_CLIENT_HEADERS) - first_client_keys
@@ -141,10 +482,12 @@ def api_clients_save(request):
 
     except Exception as exc: 
         logger.error(f"Error processing client save payload: {exc}", exc_info=True)
-        return JsonResponse({"error": f"Invalid JSON payload: {str(exc)}"}, status=400)
+        return _json({"error": f"Invalid JSON payload: {str(exc)}"}, status=400)
 
-    _write_clients_to_csv(clients)
-    return JsonResponse({"status": "ok", "count": len(clients)})
+    # Skip rewriting the file when the UI re-sends exactly what was saved last
+    if not _write_clients_to_csv(clients, digest=_clients_digest(clients)):
+        return _json({"status": "ok", "count": len(clients), "unchanged": True})
+    return _json({"status": "ok", "count": len(clients)})
 
 @csrf_exempt
 @require_http_methods(["POST"])
@@ -152,35 +495,43 @@ def api_clear_clients(request):
     """
     POST: Overwrites input_csv.csv with an empty list, clearing all client data 
     while preserving the header row structure.
+
+    This function is called by the JavaScript clearAllData() function.
     """
-    logger.warning("--- CLEAR ALL CLIENT DATA TRIGGERED ---")
+    logger.info("--- CLEAR ALL CLIENT DATA TRIGGERED ---")
     try:
         # Write an empty list, forcing the CSV file to contain only the headers.
         _write_clients_to_csv([]) 
-        return JsonResponse({"status": "ok", "message": "All client data cleared."})
+        return _json({"status": "ok", "message": "All client data cleared."})
     except Exception as exc:
         logger.error(f"Error clearing client data: {exc}", exc_info=True)
-        return JsonResponse({"error": str(exc)}, status=500)
+        return _json({"error": str(exc)}, status=500)
 
 
 
 
 @require_http_methods(["GET"])
-def api_master_data(request):
+async def api_master_data(request):
     """
     GET master/reference lists from CSVs.
     """
+    lists = await _aread_single_column_csvs([
+        "master_data/seniors.csv",
+        "master_data/members.csv",
+        "master_data/proposal_status_master.csv",
+        "master_data/gstr_status_master.csv",
+        "master_data/custom_columns.csv",
+    ])
     data = {
-        "seniors": _read_single_column_csv("master_data/seniors.csv"),
-        "members": _read_single_column_csv("master_data/members.csv"),
-        "proposalStatuses": _read_single_column_csv(
-            "master_data/proposal_status_master.csv"
-        ),
-        "gstr9Statuses": _read_single_column_csv("master_data/gstr_status_master.csv"),
-        "gstr9cStatuses": _read_single_column_csv("master_data/gstr_status_master.csv"),
-        "customColumns": _read_single_column_csv("master_data/custom_columns.csv"),
+        "seniors": lists["master_data/seniors.csv"],
+        "members": lists["master_data/members.csv"],
+        "proposalStatuses": lists["master_data/proposal_status_master.csv"],
+        # GSTR-9 and GSTR-9C share one status master; read it once
+        "gstr9Statuses": lists["master_data/gstr_status_master.csv"],
+        "gstr9cStatuses": lists["master_data/gstr_status_master.csv"],
+        "customColumns": lists["master_data/custom_columns.csv"],
     }
-    return JsonResponse(data)
+    return _json(data)
 
 
 @csrf_exempt
@@ -192,13 +543,18 @@ def api_master_data_save(request):
         return HttpResponseNotAllowed(["POST"])
 
     try:
-        payload = json.loads(request.body.decode("utf-8") or "{}")
+        payload = orjson.loads(request.body or b"{}")
     except Exception as exc: 
         logger.error(f"Error processing master data save payload: {exc}", exc_info=True)
-        return JsonResponse({"error": f"Invalid JSON payload: {str(exc)}"}, status=400)
+        return _json({"error": f"Invalid JSON payload: {str(exc)}"}, status=400)
 
     # Logging master data save to ensure the lists are populated
-    logger.warning(f"Saving Master Data: Seniors={len(payload.get('seniors', []))}, Statuses={len(payload.get('gstr9Statuses', []))}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Saving Master Data: Seniors=%d, Statuses=%d",
+            len(payload.get('seniors', [])),
+            len(payload.get('gstr9Statuses', [])),
+        )
 
 
     _write_single_column_csv(
@@ -224,263 +580,77 @@ def api_master_data_save(request):
         payload.get("customColumns", []),
     )
 
-    return JsonResponse({"status": "ok"})
-
-
-
-@csrf_exempt
-@require_http_methods(["POST"])
-def api_add_senior(request):
-    try:
-        body = json.loads(request.body.decode("utf-8"))
-        name = body.get("name", "").strip()
-
-        if not name:
-            return JsonResponse({"error": "Name is required"}, status=400)
-
-        seniors = _read_single_column_csv("master_data/seniors.csv")
-
-        if name in seniors:
-            return JsonResponse({"error": "Senior already exists"}, status=400)
-
-        seniors.append(name)
-        _write_single_column_csv("master_data/seniors.csv", "Senior", seniors)
-
-        return JsonResponse({"status": "ok", "seniors": seniors})
-
-    except Exception as e:
-        return JsonResponse({"error": str(e)}, status=500)
-
-
-@csrf_exempt
-@require_http_methods(["POST"])
-def api_remove_senior(request):
-    try:
-        body = json.loads(request.body.decode("utf-8"))
-        name = body.get("name", "").strip()
-
-        seniors = _read_single_column_csv("master_data/seniors.csv")
-
-        if name not in seniors:
-            return JsonResponse({"error": "Senior not found"}, status=404)
-
-        seniors.remove(name)
-        _write_single_column_csv("master_data/seniors.csv", "Senior", seniors)
-
-        return JsonResponse({"status": "ok", "seniors": seniors})
-
-    except Exception as e:
-        return JsonResponse({"error": str(e)}, status=500)
-
-
-
-@csrf_exempt
-@require_http_methods(["POST"])
-def api_add_member(request):
-    try:
-        body = json.loads(request.body.decode("utf-8"))
-        name = body.get("name", "").strip()
-
-        if not name:
-            return JsonResponse({"error": "Name is required"}, status=400)
-
-        members = _read_single_column_csv("master_data/members.csv")
-
-        if name in members:
-            return JsonResponse({"error": "Member already exists"}, status=400)
-
-        members.append(name)
-        _write_single_column_csv("master_data/members.csv", "Member", members)
-
-        return JsonResponse({"status": "ok", "members": members})
-
-    except Exception as e:
-        return JsonResponse({"error": str(e)}, status=500)
-
-
-@csrf_exempt
-@require_http_methods(["POST"])
-def api_remove_member(request):
-    try:
-        body = json.loads(request.body.decode("utf-8"))
-        name = body.get("name", "").strip()
-
-        members = _read_single_column_csv("master_data/members.csv")
+    return _json({"status": "ok"})
 
-        if name not in members:
-            return JsonResponse({"error": "Member not found"}, status=404)
 
-        members.remove(name)
-        _write_single_column_csv("master_data/members.csv", "Member", members)
 
-        return JsonResponse({"status": "ok", "members": members})
-
-    except Exception as e:
-        return JsonResponse({"error": str(e)}, status=500)
-
-# ---------- PROPOSAL STATUS API ----------
+# ---------- MASTER LIST ADD / REMOVE API ----------
+# One pair of views serves every one-column master list. tracker_app/urls.py binds
+# each route to its CSV file, header, request field and messages with functools.partial.
 @csrf_exempt
 @require_http_methods(["POST"])
-def api_add_proposal_status(request):
-    try:
-        body = json.loads(request.body.decode("utf-8"))
-        status = body.get("status", "").strip()
-
-        if not status:
-            return JsonResponse({"error": "No status given"}, status=400)
-
-        statuses = _read_single_column_csv("master_data/proposal_status.csv")
-
-        if status in statuses:
-            return JsonResponse({"error": "Status already exists"}, status=400)
-
-        statuses.append(status)
-        _write_single_column_csv("master_data/proposal_status.csv", "proposalStatus", statuses)
-
-        return JsonResponse({"proposalStatuses": statuses})
-    except Exception as e:
-        return JsonResponse({"error": str(e)}, status=500)
-
-
-@csrf_exempt
-@require_http_methods(["POST"])
-def api_remove_proposal_status(request):
-    try:
-        body = json.loads(request.body.decode("utf-8"))
-        status = body.get("status", "").strip()
-
-        statuses = _read_single_column_csv("master_data/proposal_status.csv")
-        statuses = [s for s in statuses if s != status]
-
-        _write_single_column_csv("master_data/proposal_status.csv", "proposalStatus", statuses)
-
-        return JsonResponse({"proposalStatuses": statuses})
-    except Exception as e:
-        return JsonResponse({"error": str(e)}, status=500)
-
-
-# ---------- GSTR-9 STATUS API ----------
-@csrf_exempt
-@require_http_methods(["POST"])
-def api_add_gstr9_status(request):
-    try:
-        body = json.loads(request.body.decode("utf-8"))
-        status = body.get("status", "").strip()
-
-        statuses = _read_single_column_csv("master_data/gstr9_status.csv")
-
-        if status in statuses:
-            return JsonResponse({"error": "Status already exists"}, status=400)
-
-        statuses.append(status)
-        _write_single_column_csv("master_data/gstr9_status.csv", "gstr9Status", statuses)
-
-        return JsonResponse({"gstr9Statuses": statuses})
-    except Exception as e:
-        return JsonResponse({"error": str(e)}, status=500)
-
-
-@csrf_exempt
-@require_http_methods(["POST"])
-def api_remove_gstr9_status(request):
-    try:
-        body = json.loads(request.body.decode("utf-8"))
-        status = body.get("status", "").strip()
-
-        statuses = _read_single_column_csv("master_data/gstr9_status.csv")
-        statuses = [s for s in statuses if s != status]
-
-        _write_single_column_csv("master_data/gstr9_status.csv", "gstr9Status", statuses)
-
-        return JsonResponse({"gstr9Statuses": statuses})
-    except Exception as e:
-        return JsonResponse({"error": str(e)}, status=500)
-
+async def api_master_add(request, *, filename, header, resp_key, field="name",
+                         empty_err=None, exists_err, ok_status=True):
+    """
+    POST {field: value}: append value to a one-column master CSV.
 
-# ---------- GSTR-9C STATUS API ----------
-@csrf_exempt
-@require_http_methods(["POST"])
-def api_add_gstr9c_status(request):
+    empty_err rejects a blank value (None lets it through); ok_status adds
+    "status": "ok" to the response alongside the updated list.
+    """
     try:
-        body = json.loads(request.body.decode("utf-8"))
-        status = body.get("status", "").strip()
+        body = orjson.loads(request.body)
+        value = body.get(field, "").strip()
 
-        statuses = _read_single_column_csv("master_data/gstr9c_status.csv")
+        if empty_err and not value:
+            return _json({"error": empty_err}, status=400)
 
-        if status in statuses:
-            return JsonResponse({"error": "Status already exists"}, status=400)
+        path = BASE_DIR / filename
+        # Warm the cache off the lock so the locked update below doesn't parse
+        await _aload_single_column(path)
+        values, added = await _alocked(
+            _apply_single_column, path, header,
+            lambda values, members: None if value in members else values + [value],
+        )
+        if not added:
+            return _json({"error": exists_err}, status=400)
 
-        statuses.append(status)
-        _write_single_column_csv("master_data/gstr9c_status.csv", "gstr9cStatus", statuses)
+        return _json({"status": "ok", resp_key: values} if ok_status else {resp_key: values})
 
-        return JsonResponse({"gstr9cStatuses": statuses})
     except Exception as e:
-        return JsonResponse({"error": str(e)}, status=500)
+        logger.error(f"Error adding to {filename}: {e}", exc_info=True)
+        return _json({"error": str(e)}, status=500)
 
 
 @csrf_exempt
 @require_http_methods(["POST"])
-def api_remove_gstr9c_status(request):
-    try:
-        body = json.loads(request.body.decode("utf-8"))
-        status = body.get("status", "").strip()
-
-        statuses = _read_single_column_csv("master_data/gstr9c_status.csv")
-        statuses = [s for s in statuses if s != status]
-
-        _write_single_column_csv("master_data/gstr9c_status.csv", "gstr9cStatus", statuses)
-
-        return JsonResponse({"gstr9cStatuses": statuses})
-    except Exception as e:
-        return JsonResponse({"error": str(e)}, status=500)
-
-@csrf_exempt
-@require_http_methods(["POST"])
-def api_add_custom_column(request):
-    try:
-        body = json.loads(request.body.decode("utf-8"))
-        column_name = body.get("name", "").strip()
-
-        if not column_name:
-            return JsonResponse({"error": "Column name is required"}, status=400)
-
-        columns = _read_single_column_csv("master_data/custom_columns.csv")
-
-        if column_name in columns:
-            return JsonResponse({"error": "Custom column already exists"}, status=400)
-
-        columns.append(column_name)
-        _write_single_column_csv("master_data/custom_columns.csv", "Custom Column", columns)
-
-        return JsonResponse({"status": "ok", "customColumns": columns})
-
-    except Exception as e:
-        logger.error(f"Error adding custom column: {e}", exc_info=True)
-        return JsonResponse({"error": str(e)}, status=500)
-
+async def api_master_remove(request, *, filename, header, resp_key, field="name",
+                            missing_err=None, ok_status=True):
+    """
+    POST {field: value}: remove value from a one-column master CSV.
 
-@csrf_exempt
-@require_http_methods(["POST"])
-def api_remove_custom_column(request):
+    missing_err returns 404 for an unknown value; with None, an unknown
+    value is a no-op that still returns the current list.
+    """
     try:
-        body = json.loads(request.body.decode("utf-8"))
-        column_name = body.get("name", "").strip()
-
-        columns = _read_single_column_csv("master_data/custom_columns.csv")
-
-        if column_name not in columns:
-            return JsonResponse({"error": "Custom column not found"}, status=404)
+        body = orjson.loads(request.body)
+        value = body.get(field, "").strip()
 
-        columns.remove(column_name)
-        _write_single_column_csv("master_data/custom_columns.csv", "Custom Column", columns)
+        path = BASE_DIR / filename
+        await _aload_single_column(path)
+        # Nothing to rewrite when the value is not in the list
+        values, removed = await _alocked(
+            _apply_single_column, path, header,
+            lambda values, members: [v for v in values if v != value] if value in members else None,
+        )
+        if missing_err and not removed:
+            return _json({"error": missing_err}, status=404)
 
-        return JsonResponse({"status": "ok", "customColumns": columns})
+        return _json({"status": "ok", resp_key: values} if ok_status else {resp_key: values})
 
     except Exception as e:
-        logger.error(f"Error removing custom column: {e}", exc_info=True)
-        return JsonResponse({"error": str(e)}, status=500)
+        logger.error(f"Error removing from {filename}: {e}", exc_info=True)
+        return _json({"error": str(e)}, status=500)
 
-import pandas as pd
 # Add these imports at the top of your views.py if not already present:
 # from django.core.files.storage import default_storage
 # from django.core.files.base import ContentFile
@@ -513,7 +683,18 @@ EXCEL_COLUMN_MAPPING = {
 # Define the final, standardized order of columns (as before)
 FINAL_HEADERS = ALL_CLIENT_HEADERS 
 
+# Precomputed once at import instead of per upload. Header names are stripped
+# before mapping, so the lookup keys are stripped too (' Turnover ' -> 'Turnover').
+_MAPPING_STRIPPED = {k.strip(): v for k, v in EXCEL_COLUMN_MAPPING.items()}
+_EXCEL_KEYS = frozenset(_MAPPING_STRIPPED)
+_FINAL_HEADERS_INDEX = pd.Index(FINAL_HEADERS)
+
 # --- Data Cleaning Helpers (Insert these, as well) ---
+# Separators ignored when matching status keywords (e.g. 'In - Progress' -> 'INPROGRESS')
+_STATUS_RE = re.compile(r'[\s\-]')
+# Excel 'Multi Registraion' values -> API Yes/No; unmapped values pass through unchanged
+_MULTI_MAP = {'Multiple': 'Yes', 'Single': 'No', '': 'No'}
+
 # def _clean_turnover(value):
 #     """Converts string values like '1.5 Cr' to numeric float."""
 #     if pd.isna(value) or value == '': return 0.0
@@ -523,17 +704,35 @@ FINAL_HEADERS = ALL_CLIENT_HEADERS
 #     try: return float(value)
 #     except ValueError: return 0.0
 
-def _clean_status(value):
-    """Standardizes GSTR status values for internal use."""
-    if pd.isna(value) or str(value).strip() == '': return 'Pending'
-    upper_value = str(value).upper().replace(' ', '').replace('-', '').strip()
-    if 'WIP' in upper_value or 'INPROGRESS' in upper_value: return 'In Progress'
-    if 'NA' in upper_value or 'NOTAPPLICABLE' in upper_value: return 'Not Applicable'
-    if 'FILED' in upper_value: return 'Filed'
-    return value.strip()
+def _clean_status(column):
+    """Standardizes a whole column of GSTR status values for internal use."""
+    text = column.astype(str)
+    stripped = text.str.strip()
+    key = text.str.upper().str.replace(_STATUS_RE, '', regex=True)
+    conditions = [
+        column.isna() | (stripped == ''),
+        key.str.contains('WIP|INPROGRESS'),
+        key.str.contains('NA|NOTAPPLICABLE'),
+        key.str.contains('FILED'),
+    ]
+    choices = ['Pending', 'In Progress', 'Not Applicable', 'Filed']
+    cleaned = np.select(conditions, choices, default=stripped.to_numpy(dtype=object))
+    return pd.Series(cleaned, index=column.index, dtype=object)
+
+def _read_tracker_sheet(uploaded_file, sheet_name):
+    """Read one sheet of an uploaded tracker workbook into a DataFrame of strings."""
+    # calamine (Rust) parses XLSX much faster than openpyxl's pure-Python reader.
+    # FIX: Use header=2 to specifically fetch Excel Row 3 as column names.
+    # Only materialize the columns we map; everything else is dropped later anyway.
+    return pd.read_excel(
+        uploaded_file,
+        sheet_name=sheet_name,
+        header=2,
+        engine='calamine',
+        usecols=lambda col: str(col).strip() in _EXCEL_KEYS,
+        dtype=str,
+    )
 
-@csrf_exempt
-@require_http_methods(["POST"])
 @csrf_exempt
 @require_http_methods(["POST"])
 def api_upload_tracker(request):
@@ -541,139 +740,110 @@ def api_upload_tracker(request):
     POST: Accepts an uploaded Excel/CSV file, extracts data from the Tracker sheet,
     maps headers, cleans data, and overwrites input_csv.csv.
     """
-    logger.warning("--- API UPLOAD TRACKER STARTED ---")
+    logger.info("--- API UPLOAD TRACKER STARTED ---")
 
     if 'file' not in request.FILES:
         logger.error("No file uploaded.")
-        return JsonResponse({"error": "No file uploaded."}, status=400)
+        return _json({"error": "No file uploaded."}, status=400)
 
     uploaded_file = request.FILES['file']
     
     try:
-        with pd.ExcelFile(uploaded_file) as xls:
-            sheet_name = 'Tracker'
-            if sheet_name not in xls.sheet_names:
-                sheet_name = xls.sheet_names[0] 
-                logger.warning(f"DEBUG: 'Tracker' sheet not found. Using first sheet: {sheet_name}")
-
-            # FIX: Use header=2 to specifically fetch Excel Row 3 as column names
-            df = pd.read_excel(xls, sheet_name=sheet_name, header=2) 
-            
-            # 1a. Initial Column Cleaning (before mapping)
-            df.columns = df.columns.astype(str).str.strip()
-            
-            # --- DEBUGGING STEP 1: Check Raw Headers and Data ---
-            logger.warning(f"DEBUG 1: Sheet '{sheet_name}' loaded. Shape: {df.shape}")
-            logger.warning(f"DEBUG 1: Raw Columns Read by Pandas: {list(df.columns)}")
-            # --- END DEBUGGING STEP 1 ---
-
-            # --- CRITICAL FIX 1: Filter out blank rows based on 'Sr'/'Client Name' ---
-            CRITICAL_COLS_TO_CHECK = ['Client Name'] 
-            
-            # Drop rows where ALL values are NaN (first general cleanup)
-            df.dropna(how='all', inplace=True)
-            
-            available_critical_cols = [col for col in CRITICAL_COLS_TO_CHECK if col in df.columns]
-            
-            if available_critical_cols:
-                # Filter: Keep rows where AT LEAST ONE of the critical columns is NOT Null/Empty
-                is_critical_missing = df[available_critical_cols].isnull().all(axis=1)
-                df = df[~is_critical_missing] 
-            
-            logger.warning(f"DEBUG: DataFrame shape after cleaning empty rows: {df.shape}")
-
-            if 'Sr' in df.columns:
-                # Identify rows where the 'Sr' column exactly matches the string 'Sr' (case-insensitive)
-                # We also check for NaN/None and force conversion to string first for safety.
-                is_redundant_header_row = df['Sr'].astype(str).str.strip().str.lower() == 'sr'
-                
-                # Filter the DataFrame to KEEP ONLY rows that are NOT redundant headers
-                df = df[~is_redundant_header_row] 
-                
-                logger.warning(f"DEBUG: {is_redundant_header_row.sum()} redundant header/separator rows removed.")
-            # --- END CRITICAL FIX 1 ---
-            
-            
-            # --- NEW LOGIC: Remove redundant header/separator rows (Pattern: 'Client Name' == 'not applicable') ---
-            if 'Client Name' in df.columns:
-                # Identify rows where 'Client Name' is the specific cleanup string
-                is_redundant_header_row = df['Client Name'].astype(str).str.strip().str.lower() == 'not applicable'
-                
-                # Filter the DataFrame to KEEP ONLY rows that are NOT redundant headers
-                df = df[~is_redundant_header_row] 
-                
-                logger.warning(f"DEBUG: {is_redundant_header_row.sum()} redundant header/separator rows removed.")
-            
-            # --- END NEW LOGIC ---
-
-            # 2. Process the data and map headers
-            
-            # 2a. Rename columns
-            df.rename(columns=EXCEL_COLUMN_MAPPING, inplace=True)
-            
-            # 2b. Select and reorder columns, filling missing API columns with empty strings
-            df_final = df.reindex(columns=FINAL_HEADERS).fillna('')
-
-            # 2c. Apply data cleaning 
-            df_final['turnover'] = df_final['turnover']
-            df_final['multiRegistration'] = df_final['multiRegistration'].replace({'Multiple': 'Yes', 'Single': 'No', '': 'No'})
-            df_final['gstr9Status'] = df_final['gstr9Status'].apply(_clean_status)
-            df_final['gstr9cStatus'] = df_final['gstr9cStatus'].apply(_clean_status)
-            df_final['proposalStatus'] = df_final['proposalStatus'].apply(_clean_status)
-            
-            # --- DEBUGGING STEP 3: Check Final Mapped Data ---
-            if not df_final.empty:
-                final_first_row = df_final.iloc[0].to_dict()
-                log_mapped_data = {k: final_first_row.get(k, 'MISSING') for k in ['sr', 'clientName', 'gstin', 'turnover', 'gstr9Status', 'member']}
-                logger.warning(f"DEBUG 3: First row data (AFTER MAPPING/CLEANING): {log_mapped_data}")
-            # --- END DEBUGGING STEP 3 ---
-
-            records = df_final.to_dict('records')
+        # Read the sheet directly; probing sheet names first would parse the workbook twice
+        sheet_name = 'Tracker'
+        try:
+            df = _read_tracker_sheet(uploaded_file, sheet_name)
+        except ValueError as exc:
+            # Only a missing 'Tracker' sheet falls back; any other read error is real
+            if f"Worksheet named '{sheet_name}' not found" not in str(exc):
+                raise
+            # Rewind the consumed upload stream and use the first sheet
+            sheet_name = 0
+            logger.warning("'Tracker' sheet not found. Using first sheet.")
+            uploaded_file.seek(0)
+            df = _read_tracker_sheet(uploaded_file, sheet_name)
+        
+        # 1a. Initial Column Cleaning (before mapping)
+        df.columns = df.columns.astype(str).str.strip()
+        
+        # --- DEBUGGING STEP 1: Check Raw Headers and Data ---
+        logger.debug("DEBUG 1: Sheet '%s' loaded. Shape: %s", sheet_name, df.shape)
+        logger.debug("DEBUG 1: Raw Columns Read by Pandas: %s", df.columns)
+        # --- END DEBUGGING STEP 1 ---
+
+        # --- CRITICAL FIX 1: Filter out blank rows based on 'Sr'/'Client Name' ---
+        # All row filters are combined into one boolean mask and applied once,
+        # instead of building an intermediate DataFrame per filter.
+        CRITICAL_COLS_TO_CHECK = ['Client Name'] 
+        
+        # Drop rows where ALL values are NaN (first general cleanup)
+        keep = df.notna().any(axis=1)
+        
+        available_critical_cols = [col for col in CRITICAL_COLS_TO_CHECK if col in df.columns]
+        
+        if available_critical_cols:
+            # Filter: Keep rows where AT LEAST ONE of the critical columns is NOT Null/Empty
+            keep &= df[available_critical_cols].notna().any(axis=1)
+
+        if 'Sr' in df.columns:
+            # Drop rows where the 'Sr' column exactly matches the string 'Sr' (case-insensitive)
+            # We also check for NaN/None and force conversion to string first for safety.
+            keep &= df['Sr'].astype(str).str.strip().str.lower() != 'sr'
+        # --- END CRITICAL FIX 1 ---
+        
+        # --- NEW LOGIC: Remove redundant header/separator rows (Pattern: 'Client Name' == 'not applicable') ---
+        if 'Client Name' in df.columns:
+            keep &= df['Client Name'].astype(str).str.strip().str.lower() != 'not applicable'
+        # --- END NEW LOGIC ---
+
+        df = df[keep]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DEBUG: %s empty/redundant header rows removed. Shape: %s", (~keep).sum(), df.shape)
+
+        # 2. Process the data and map headers
+        
+        # 2a. Rename columns
+        df.rename(columns=_MAPPING_STRIPPED, inplace=True)
+        
+        # 2b. Select and reorder columns, filling missing API columns with empty strings
+        df_final = df.reindex(columns=_FINAL_HEADERS_INDEX).fillna('')
+
+        # 2c. Apply data cleaning 
+        df_final['turnover'] = df_final['turnover']
+        multi_reg = df_final['multiRegistration']
+        df_final['multiRegistration'] = multi_reg.map(_MULTI_MAP).fillna(multi_reg)
+        df_final['gstr9Status'] = _clean_status(df_final['gstr9Status'])
+        df_final['gstr9cStatus'] = _clean_status(df_final['gstr9cStatus'])
+        df_final['proposalStatus'] = _clean_status(df_final['proposalStatus'])
+        
+        # --- DEBUGGING STEP 3: Check Final Mapped Data ---
+        if not df_final.empty and logger.isEnabledFor(logging.DEBUG):
+            final_first_row = df_final.iloc[0].to_dict()
+            log_mapped_data = {k: final_first_row.get(k, 'MISSING') for k in ['sr', 'clientName', 'gstin', 'turnover', 'gstr9Status', 'member']}
+            logger.debug("DEBUG 3: First row data (AFTER MAPPING/CLEANING): %s", log_mapped_data)
+        # --- END DEBUGGING STEP 3 ---
+
+        count = len(df_final)
 
     except Exception as e:
         logger.error(f"Error during data processing/mapping: {e}", exc_info=True)
-        return JsonResponse({"error": f"Error processing data mapping: {e}"}, status=500)
+        return _json({"error": f"Error processing data mapping: {e}"}, status=500)
 
     # 3. Overwrite the central CSV data file
     try:
-        _write_clients_to_csv(records)
-        logger.warning(f"Successfully loaded and saved {len(records)} records from uploaded file.")
+        _write_clients_frame(df_final)
+        logger.info("Successfully loaded and saved %d records from uploaded file.", count)
         
-        return JsonResponse({
+        return _json({
             "status": "ok", 
-            "count": len(records),
-            "message": f"Successfully updated tracker data with {len(records)} records."
+            "count": count,
+            "message": f"Successfully updated tracker data with {count} records."
         })
     except Exception as e:
         logger.error(f"Error writing to CSV: {e}", exc_info=True)
-        return JsonResponse({"error": f"Server failed to save updated data: {e}"}, status=500)
+        return _json({"error": f"Server failed to save updated data: {e}"}, status=500)
 
-@csrf_exempt
-@require_http_methods(["POST"])
-def api_clear_clients(request):
-    """
-    POST: Overwrites input_csv.csv with an empty list, clearing all client data 
-    while preserving the header row structure.
-    
-    This function is called by the JavaScript clearAllData() function.
-    """
-    logger.warning("--- CLEAR ALL CLIENT DATA TRIGGERED ---")
-    
-    # 1. Validation (Ensures it's a POST request, though decorator handles most of this)
-    if request.method != "POST":
-        return HttpResponseNotAllowed(["POST"])
 
-    try:
-        # 2. Overwrite the client CSV file with an empty list
-        # This function preserves the header row based on the ALL_CLIENT_HEADERS global list.
-        _write_clients_to_csv([]) 
-        
-        # 3. Return a successful response
-        return JsonResponse({"status": "ok", "message": "All client data cleared."})
-        
-    except Exception as exc:
-        logger.error(f"Error clearing client data: {exc}", exc_info=True)
-        return JsonResponse({"error": str(exc)}, status=500)
 @require_http_methods(["GET"])
 def tracker_home(request):
     print("Rendering template.html")